@@ -5,9 +5,14 @@ A clean FastAPI application for tracking job applications with PostgreSQL integr
 optimized for deployment on Render.com
 """
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError
+from sqlalchemy.orm.exc import StaleDataError
 from contextlib import asynccontextmanager
+from datetime import datetime
+import logging
 import os
 from dotenv import load_dotenv
 
@@ -20,6 +25,8 @@ from database import init_db
 # Import routers
 from routers import jobs, auth
 
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -35,7 +42,8 @@ app = FastAPI(
     title="Job Application Tracker API",
     description="A comprehensive API for tracking job applications",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS for production
@@ -54,14 +62,54 @@ else:
     if env_origins:
         allowed_origins = env_origins.split(",")
 
+# Normalize once at startup: strip whitespace, drop empties, dedupe in order
+allowed_origins = tuple(dict.fromkeys(o.strip() for o in allowed_origins if o.strip()))
+
+# Browsers reject credentialed responses for a wildcard origin
+allow_credentials = "*" not in allowed_origins
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_origin_regex=None,
+    allow_credentials=allow_credentials,
+    allow_methods=("GET", "POST", "PUT", "DELETE", "OPTIONS"),
     allow_headers=["*"],
 )
 
+# Exception handlers
+def error_response(status_code: int, message: str, error_code: str) -> ORJSONResponse:
+    """Build an ErrorResponse-shaped body without leaking internal details."""
+    return ORJSONResponse(
+        status_code=status_code,
+        content={
+            "success": False,
+            "message": message,
+            "errors": [message],
+            "error_code": error_code,
+            "timestamp": datetime.utcnow()
+        }
+    )
+
+
+@app.exception_handler(SQLAlchemyError)
+async def db_error_handler(request: Request, exc: SQLAlchemyError):
+    """Map database errors to a generic response; constraint/data errors and conflicts are client errors."""
+    if isinstance(exc, (IntegrityError, DataError)):
+        return error_response(status.HTTP_400_BAD_REQUEST, "Invalid data for this operation", "invalid_data")
+    if isinstance(exc, StaleDataError):
+        # The row's version counter moved on under a concurrent update or delete
+        return error_response(status.HTTP_409_CONFLICT, "Record was modified concurrently", "conflict")
+    logger.exception("Database error on %s %s", request.method, request.url.path)
+    return error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, "Database error", "database_error")
+
+
+@app.exception_handler(Exception)
+async def generic_error_handler(request: Request, exc: Exception):
+    """Catch-all for unexpected errors; the traceback is logged by the server."""
+    return error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal server error", "internal_error")
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -5,12 +5,18 @@ This module contains all the data models used throughout the API for
 request/response validation, database schemas, and data transfer objects.
 """
 
-from pydantic import BaseModel, HttpUrl, Field, field_validator, model_validator, EmailStr
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field, field_serializer, field_validator, model_validator, EmailStr
+from typing import Optional, List, Dict, Any, Generic, TypeVar
 from datetime import datetime, date
 from enum import Enum
 import re
 
+# Precompiled validation patterns
+_CURRENCY_RE = re.compile(r'^[A-Z]{3}$')
+
+# Payload type for the generic response wrappers
+T = TypeVar("T")
+
 
 # Enums for job application status and types
 class ApplicationStatus(str, Enum):
@@ -88,9 +94,15 @@ class ApplicationBase(BaseModel):
     @field_validator('currency')
     @classmethod
     def validate_currency(cls, v):
-        if not re.match(r'^[A-Z]{3}$', v.upper()):
+        u = v.upper()
+        if len(u) != 3 or not _CURRENCY_RE.match(u):
             raise ValueError('Currency must be a 3-letter code (e.g., USD, EUR)')
-        return v.upper()
+        return u
+
+    @field_serializer('job_url')
+    def serialize_job_url(self, v):
+        # model_dump feeds the ORM directly and DB drivers cannot bind a Url
+        return str(v) if v is not None else None
 
     @model_validator(mode='after')
     def validate_salary_range(self):
@@ -135,27 +147,69 @@ class ApplicationUpdate(BaseModel):
     @field_validator('currency')
     @classmethod
     def validate_currency(cls, v):
-        if v is not None and not re.match(r'^[A-Z]{3}$', v.upper()):
+        if v is None:
+            return v
+        u = v.upper()
+        if len(u) != 3 or not _CURRENCY_RE.match(u):
             raise ValueError('Currency must be a 3-letter code (e.g., USD, EUR)')
-        return v.upper() if v else v
+        return u
+
+    @field_serializer('job_url')
+    def serialize_job_url(self, v):
+        # model_dump feeds the ORM directly and DB drivers cannot bind a Url
+        return str(v) if v is not None else None
+
+
+class ApplicationResponse(TimestampMixin):
+    """
+    Model for job application API responses with ID and timestamps.
+
+    Built from stored rows, so fields carry plain types with no constraints or
+    validators; input rules live on the request models only.
+    """
+    company_name: str
+    job_title: str
+    job_url: Optional[str] = None
+    job_description: Optional[str] = None
+    location: Optional[str] = None
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    currency: Optional[str] = None
+    job_type: Optional[JobType] = None
+    remote_type: Optional[RemoteType] = None
+    application_date: Optional[date] = None
+    deadline: Optional[date] = None
+    priority: Optional[Priority] = None
+    notes: Optional[str] = None
+    referral_name: Optional[str] = None
+    contact_email: Optional[str] = None
+    contact_person: Optional[str] = None
+    id: int
+    status: Optional[ApplicationStatus] = None
+    days_since_applied: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
-class ApplicationResponse(ApplicationBase, TimestampMixin):
-    """Model for job application API responses with ID and timestamps."""
+class ApplicationSummaryResponse(TimestampMixin):
+    """Compact job application model for list views."""
     id: int
-    status: ApplicationStatus
+    company_name: str
+    job_title: str
+    status: Optional[ApplicationStatus] = None
+    priority: Optional[Priority] = None
+    application_date: Optional[date] = None
     days_since_applied: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
 # Generic API response models
-class APIResponse(BaseModel):
+class APIResponse(BaseModel, Generic[T]):
     """Generic API response model."""
     success: bool = True
     message: str = "Operation completed successfully"
-    data: Optional[Any] = None
+    data: Optional[T] = None
     errors: Optional[List[str]] = None
     timestamp: Optional[datetime] = None
 
@@ -170,15 +224,16 @@ class ErrorResponse(BaseModel):
 
 
 # Pagination models
-class PaginatedResponse(BaseModel):
+class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response model."""
-    items: List[Any]
+    items: List[T]
     total: int = Field(ge=0)
     page: int = Field(ge=1)
     limit: int = Field(ge=1)
     pages: int = Field(ge=0)
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[int] = None
 
 
 # User models for authentication
@@ -199,8 +254,7 @@ class UserResponse(UserBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Token(BaseModel):
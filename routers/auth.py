@@ -7,9 +7,11 @@ and login functionality. Can be extended with JWT tokens for full auth system.
 
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from passlib.context import CryptContext
 from datetime import datetime
+import asyncio
+import os
 
 from database import get_db, UserOperations
 from models import UserCreate, UserResponse, Token
@@ -17,18 +19,21 @@ from models import UserCreate, UserResponse, Token
 router = APIRouter()
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 security = HTTPBearer()
 
 
-def hash_password(password: str) -> str:
-    """Hash a password for storage."""
-    return pwd_context.hash(password)
+async def hash_password(password: str) -> str:
+    """Hash a password for storage without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, pwd_context.hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, pwd_context.verify, plain_password, hashed_password)
 
 
 def create_success_response(message: str, data=None) -> dict:
@@ -44,7 +49,7 @@ def create_success_response(message: str, data=None) -> dict:
 @router.post("/register", status_code=status.HTTP_201_CREATED, summary="Register a new user")
 async def register_user(
     user: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Register a new user account.
@@ -58,7 +63,7 @@ async def register_user(
     """
     try:
         # Check if user already exists
-        existing_user = UserOperations.get_user_by_email(db=db, email=user.email)
+        existing_user = await UserOperations.get_user_by_email(db=db, email=user.email)
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -66,8 +71,8 @@ async def register_user(
             )
         
         # Hash password and create user
-        hashed_password = hash_password(user.password)
-        db_user = UserOperations.create_user(
+        hashed_password = await hash_password(user.password)
+        db_user = await UserOperations.create_user(
             db=db,
             email=user.email,
             hashed_password=hashed_password,
@@ -80,7 +85,7 @@ async def register_user(
             "email": db_user.email,
             "full_name": db_user.full_name,
             "is_active": db_user.is_active,
-            "created_at": db_user.created_at.isoformat() if db_user.created_at else None
+            "created_at": db_user.created_at
         }
         
         return create_success_response(
@@ -101,7 +106,7 @@ async def register_user(
 async def login_user(
     email: str,
     password: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Login user with email and password.
@@ -111,7 +116,7 @@ async def login_user(
     """
     try:
         # Get user by email
-        db_user = UserOperations.get_user_by_email(db=db, email=email)
+        db_user = await UserOperations.get_user_by_email(db=db, email=email)
         if not db_user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -119,7 +124,7 @@ async def login_user(
             )
         
         # Verify password
-        if not verify_password(password, db_user.hashed_password):
+        if not await verify_password(password, db_user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
@@ -160,7 +165,7 @@ async def login_user(
 @router.get("/profile", summary="Get user profile")
 async def get_profile(
     user_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get user profile information.
@@ -169,7 +174,7 @@ async def get_profile(
     instead of passing it as a parameter.
     """
     try:
-        db_user = UserOperations.get_user_by_id(db=db, user_id=user_id)
+        db_user = await UserOperations.get_user_by_id(db=db, user_id=user_id)
         if not db_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -181,8 +186,8 @@ async def get_profile(
             "email": db_user.email,
             "full_name": db_user.full_name,
             "is_active": db_user.is_active,
-            "created_at": db_user.created_at.isoformat() if db_user.created_at else None,
-            "updated_at": db_user.updated_at.isoformat() if db_user.updated_at else None
+            "created_at": db_user.created_at,
+            "updated_at": db_user.updated_at
         }
         
         return create_success_response(
@@ -5,17 +5,24 @@ This module provides comprehensive REST endpoints for managing job applications,
 including pagination, filtering, and proper error handling.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
 from typing import List, Optional
-from datetime import datetime
-import math
+from datetime import datetime, date
+import asyncio
+import hashlib
+import operator
+import os
+import time
 
-from database import get_db, DatabaseOperations, Application
+from database import get_db, DatabaseOperations, SessionLocal, Application, APPLICATION_SUMMARY_COLUMNS
 from models import (
     ApplicationCreate,
     ApplicationUpdate,
     ApplicationResponse,
+    ApplicationSummaryResponse,
     ApplicationStatus,
     APIResponse,
     PaginatedResponse
@@ -23,114 +30,190 @@ from models import (
 
 router = APIRouter()
 
+# Short-lived, per-process cache for /stats/summary. Writes bump the version so a
+# cached payload is never served after this process has changed the data.
+STATS_CACHE_TTL = float(os.getenv("STATS_CACHE_TTL", 15))
+_stats_version = 0
+_stats_cache: Optional[tuple[int, float, dict]] = None  # (version, expires_at, stats)
+_stats_lock = asyncio.Lock()
+
+# Read endpoints may be reused briefly by the client; ETags let it revalidate cheaply
+READ_CACHE_CONTROL = "private, max-age=5"
+
+# Export rows are written as plain mappings with the ApplicationResponse fields;
+# stored data is not re-validated mid-stream, after the 200 has been sent
+_EXPORT_KEYS = tuple(ApplicationResponse.model_fields)
+_EXPORT_FIELDS = operator.attrgetter(*_EXPORT_KEYS)
+
 # Helper functions
-def calculate_pagination(total: int, page: int, limit: int) -> dict:
-    """Calculate pagination metadata."""
-    pages = math.ceil(total / limit) if total > 0 else 0
-    return {
-        "total": total,
-        "page": page,
-        "limit": limit,
-        "pages": pages,
-        "has_next": page < pages,
-        "has_previous": page > 1
-    }
+_SUCCESS_TEMPLATE = {"success": True}
+_timestamp_cache: tuple[int, datetime] = (0, datetime.utcfromtimestamp(0))
+
+
+def response_timestamp() -> datetime:
+    """Current UTC time at one-second resolution, rebuilt at most once per second."""
+    global _timestamp_cache
+    second = int(time.time())
+    if _timestamp_cache[0] != second:
+        _timestamp_cache = (second, datetime.utcfromtimestamp(second))
+    return _timestamp_cache[1]
 
 
 def create_success_response(message: str, data=None) -> dict:
     """Create standardized success response."""
-    return {
-        "success": True,
-        "message": message,
-        "data": data,
-        "timestamp": datetime.utcnow()
-    }
+    return {**_SUCCESS_TEMPLATE, "message": message, "data": data, "timestamp": response_timestamp()}
 
 
-def application_to_response(app: Application) -> dict:
-    """Convert database application to response format."""
-    return {
-        "id": app.id,
-        "company_name": app.company_name,
-        "job_title": app.job_title,
-        "job_url": str(app.job_url) if app.job_url else None,
-        "job_description": app.job_description,
-        "location": app.location,
-        "salary_min": app.salary_min,
-        "salary_max": app.salary_max,
-        "currency": app.currency,
-        "job_type": app.job_type.value if app.job_type else None,
-        "remote_type": app.remote_type.value if app.remote_type else None,
-        "application_date": app.application_date.isoformat() if app.application_date else None,
-        "deadline": app.deadline.isoformat() if app.deadline else None,
-        "status": app.status.value,
-        "priority": app.priority.value,
-        "notes": app.notes,
-        "referral_name": app.referral_name,
-        "contact_email": app.contact_email,
-        "contact_person": app.contact_person,
-        "days_since_applied": app.days_since_applied,
-        "created_at": app.created_at.isoformat() if app.created_at else None,
-        "updated_at": app.updated_at.isoformat() if app.updated_at else None
-    }
+def make_etag(*parts) -> str:
+    """Build a strong ETag from the values that determine a response body."""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def application_version(app: Application) -> str:
+    """Identify the stored state of an application for ETag purposes."""
+    return f"{app.id}:{app.version_id}"
+
+
+def check_not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Set caching headers and return a 304 response if the client's copy is current.
+
+    Returns None when the full response should be sent.
+    """
+    headers = {"ETag": etag, "Cache-Control": READ_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def invalidate_stats_cache() -> None:
+    """Mark cached statistics as stale after a write."""
+    global _stats_version
+    _stats_version += 1
+
+
+async def get_cached_stats(db: AsyncSession) -> dict:
+    """Return application statistics, recomputing at most once per TTL window."""
+    global _stats_cache
+    cached = _stats_cache
+    if cached and cached[0] == _stats_version and cached[1] > time.monotonic():
+        return cached[2]
+    
+    async with _stats_lock:
+        # Another request may have refreshed the cache while we waited
+        cached = _stats_cache
+        if cached and cached[0] == _stats_version and cached[1] > time.monotonic():
+            return cached[2]
+        
+        version = _stats_version
+        counts = await DatabaseOperations.count_by_status(db)
+        stats = {
+            "total_applications": sum(counts.values()),
+            "applications_by_status": {
+                status_enum.value: counts.get(status_enum, 0)
+                for status_enum in ApplicationStatus
+            },
+            "message": "Statistics retrieved successfully"
+        }
+        _stats_cache = (version, time.monotonic() + STATS_CACHE_TTL, stats)
+        return stats
 
 
 # API Endpoints
-@router.get("/", summary="List all job applications")
+@router.get(
+    "/",
+    response_model=PaginatedResponse[ApplicationSummaryResponse],
+    summary="List all job applications"
+)
 async def list_applications(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     status: Optional[ApplicationStatus] = Query(None, description="Filter by status"),
     company_name: Optional[str] = Query(None, description="Filter by company name"),
-    db: Session = Depends(get_db)
+    cursor: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Keyset cursor: next_cursor from the previous page, or 0 to start from the newest"
+    ),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve a paginated list of job applications with optional filtering.
     
     **Features:**
-    - Pagination support
+    - Pagination support (page-based, or keyset via `cursor` for deep pages)
     - Filter by application status
     - Filter by company name (partial match)
-    - Returns calculated fields like days_since_applied
+    - Returns summary fields plus calculated fields like days_since_applied;
+      use `GET /{application_id}` for the full record
     """
-    try:
-        # Get total count for pagination
-        total = DatabaseOperations.get_application_count(db)
-        
-        # Calculate skip for pagination
-        skip = (page - 1) * limit
-        
-        # Get applications with filtering
-        applications = DatabaseOperations.get_applications(
-            db=db,
-            skip=skip,
-            limit=limit,
-            status=status,
-            company_name=company_name
-        )
-        
-        # Convert to response format
-        items = [application_to_response(app) for app in applications]
-        
-        # Calculate pagination metadata
-        pagination = calculate_pagination(total, page, limit)
-        
-        return {
-            "items": items,
-            **pagination
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving applications: {str(e)}"
-        )
+    # Calculate skip for pagination
+    skip = (page - 1) * limit
+    
+    # Validate against a cheap count/version query before fetching the page;
+    # "today" is part of it because days_since_applied depends on it
+    total, version, today = await DatabaseOperations.get_listing_version(
+        db,
+        status=status,
+        company_name=company_name
+    )
+    etag = make_etag(today, total, version, page, limit, cursor, status, company_name)
+    not_modified = check_not_modified(request, response, etag)
+    if not_modified:
+        return not_modified
+    
+    # Runs on the same request session, so a list request only ever holds
+    # one pooled connection. Keyset pages fetch one extra row to learn
+    # whether another page follows.
+    applications = await DatabaseOperations.get_applications(
+        db=db,
+        skip=skip,
+        limit=limit if cursor is None else limit + 1,
+        status=status,
+        company_name=company_name,
+        cursor=cursor,
+        columns=APPLICATION_SUMMARY_COLUMNS
+    )
+    
+    # Calculate pagination metadata
+    if cursor is None:
+        next_cursor = None
+        has_next = page * limit < total
+        has_previous = page > 1
+    else:
+        has_next = len(applications) > limit
+        del applications[limit:]
+        next_cursor = applications[-1].id if has_next else None
+        has_previous = cursor > 0
+    
+    return {
+        "items": applications,
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "pages": (total + limit - 1) // limit,
+        "has_next": has_next,
+        "has_previous": has_previous,
+        "next_cursor": next_cursor
+    }
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED, summary="Create a new job application")
+@router.post(
+    "/",
+    response_model=APIResponse[ApplicationResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create a new job application"
+)
 async def create_application(
     application: ApplicationCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new job application.
@@ -142,170 +225,164 @@ async def create_application(
     **Optional fields:**
     - All other fields from the ApplicationCreate model
     """
-    try:
-        # Convert Pydantic model to dict, excluding None values for optional fields
-        application_data = application.dict(exclude_unset=True)
-        
-        # Create application in database
-        db_application = DatabaseOperations.create_application(
-            db=db, 
-            application_data=application_data
-        )
-        
-        return create_success_response(
-            message="Application created successfully",
-            data=application_to_response(db_application)
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Error creating application: {str(e)}"
-        )
+    # Convert Pydantic model to dict, excluding fields the client did not send
+    application_data = application.model_dump(exclude_unset=True, mode="python")
+    
+    # Create application in database
+    db_application = await DatabaseOperations.create_application(
+        db=db, 
+        application_data=application_data
+    )
+    invalidate_stats_cache()
+    
+    return create_success_response(
+        message="Application created successfully",
+        data=db_application
+    )
+
+
+@router.get("/export", summary="Export job applications as NDJSON")
+async def export_applications(
+    status: Optional[ApplicationStatus] = Query(None, description="Filter by status"),
+    company_name: Optional[str] = Query(None, description="Filter by company name")
+):
+    """
+    Stream all matching job applications as newline-delimited JSON.
+    
+    Rows are read through a server-side cursor and written as they arrive,
+    so memory stays flat regardless of how many applications are exported.
+    """
+    async def generate():
+        # The stream outlives the request handler, so it owns its session
+        async with SessionLocal() as db:
+            async for app in DatabaseOperations.get_applications_stream(
+                db,
+                status=status,
+                company_name=company_name
+            ):
+                row = dict(zip(_EXPORT_KEYS, _EXPORT_FIELDS(app)))
+                yield orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
-@router.get("/{application_id}", summary="Get a specific job application")
+@router.get(
+    "/{application_id}",
+    response_model=APIResponse[ApplicationResponse],
+    summary="Get a specific job application"
+)
 async def get_application(
     application_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve a specific job application by ID.
     """
-    try:
-        db_application = DatabaseOperations.get_application(db=db, application_id=application_id)
-        
-        if not db_application:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Application not found"
-            )
-        
-        return create_success_response(
-            message="Application retrieved successfully",
-            data=application_to_response(db_application)
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    db_application = await DatabaseOperations.get_application(db=db, application_id=application_id)
+    
+    if not db_application:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving application: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
         )
+    
+    etag = make_etag(date.today(), application_version(db_application))
+    not_modified = check_not_modified(request, response, etag)
+    if not_modified:
+        return not_modified
+    
+    return create_success_response(
+        message="Application retrieved successfully",
+        data=db_application
+    )
 
 
-@router.put("/{application_id}", summary="Update a job application")
+@router.put(
+    "/{application_id}",
+    response_model=APIResponse[ApplicationResponse],
+    summary="Update a job application"
+)
 async def update_application(
     application_id: int,
     application: ApplicationUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update an existing job application.
     
     Only provided fields will be updated. Omitted fields will remain unchanged.
     """
-    try:
-        # Convert to dict, excluding None values
-        update_data = application.dict(exclude_unset=True, exclude_none=True)
-        
-        if not update_data:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No fields provided for update"
-            )
-        
-        # Update application
-        db_application = DatabaseOperations.update_application(
-            db=db,
-            application_id=application_id,
-            update_data=update_data
-        )
-        
-        if not db_application:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Application not found"
-            )
-        
-        return create_success_response(
-            message="Application updated successfully",
-            data=application_to_response(db_application)
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    # Convert to dict, excluding unset and None values in a single pass
+    update_data = application.model_dump(exclude_unset=True, exclude_none=True, mode="python")
+    
+    if not update_data:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Error updating application: {str(e)}"
+            detail="No fields provided for update"
+        )
+    
+    # Update application
+    db_application = await DatabaseOperations.update_application(
+        db=db,
+        application_id=application_id,
+        update_data=update_data
+    )
+    
+    if not db_application:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
         )
+    invalidate_stats_cache()
+    
+    return create_success_response(
+        message="Application updated successfully",
+        data=db_application
+    )
 
 
-@router.delete("/{application_id}", summary="Delete a job application")
+@router.delete("/{application_id}", response_model=APIResponse, summary="Delete a job application")
 async def delete_application(
     application_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a job application by ID.
     """
-    try:
-        success = DatabaseOperations.delete_application(db=db, application_id=application_id)
-        
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Application not found"
-            )
-        
-        return create_success_response(
-            message="Application deleted successfully",
-            data={"deleted_id": application_id}
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    success = await DatabaseOperations.delete_application(db=db, application_id=application_id)
+    
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error deleting application: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
         )
+    invalidate_stats_cache()
+    
+    return create_success_response(
+        message="Application deleted successfully",
+        data={"deleted_id": application_id}
+    )
 
 
-@router.get("/stats/summary", summary="Get application statistics")
-async def get_application_stats(db: Session = Depends(get_db)):
+@router.get("/stats/summary", response_model=APIResponse, summary="Get application statistics")
+async def get_application_stats(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+):
     """
     Get summary statistics for job applications.
     """
-    try:
-        total_applications = DatabaseOperations.get_application_count(db)
-        
-        # Get applications by status
-        stats = {
-            "total_applications": total_applications,
-            "applications_by_status": {},
-            "message": "Statistics retrieved successfully"
-        }
-        
-        # Count applications by each status
-        from models import ApplicationStatus
-        for status_enum in ApplicationStatus:
-            count = len(DatabaseOperations.get_applications(
-                db=db, 
-                status=status_enum, 
-                limit=1000  # Get all for counting
-            ))
-            stats["applications_by_status"][status_enum.value] = count
-        
-        return create_success_response(
-            message="Statistics retrieved successfully",
-            data=stats
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving statistics: {str(e)}"
-        )
+    stats = await get_cached_stats(db)
+    
+    etag = make_etag(stats["total_applications"], *stats["applications_by_status"].values())
+    not_modified = check_not_modified(request, response, etag)
+    if not_modified:
+        return not_modified
+    
+    return create_success_response(
+        message="Statistics retrieved successfully",
+        data=stats
+    )